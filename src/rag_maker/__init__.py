@@ -1,7 +1,17 @@
 """RAG Maker package powered by Google AI File Search."""
 
-from .config import Settings
-from .file_search import FileSearchManager
-
 __all__ = ["Settings", "FileSearchManager"]
 
+
+def __getattr__(name: str):
+    # Resolve exports on first access so importing a submodule (e.g. the
+    # service on a serverless cold start) does not drag in the rest.
+    if name == "Settings":
+        from .config import Settings
+
+        return Settings
+    if name == "FileSearchManager":
+        from .file_search import FileSearchManager
+
+        return FileSearchManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,41 +1,49 @@
 from __future__ import annotations
 
 import os
+from dataclasses import dataclass
 from functools import lru_cache
 from typing import Optional
 
-try:
-    from dotenv import load_dotenv
-except ImportError:  # pragma: no cover - optional dependency
-    def load_dotenv(*_args, **_kwargs):
-        """Fallback no-op when python-dotenv is not installed."""
-        return False
-
-try:
-    from pydantic_settings import BaseSettings
-except ImportError:  # pragma: no cover - optional dependency
-    BaseSettings = object  # type: ignore[assignment]
+DEFAULT_MODEL = "models/gemini-1.5-flash-002"
+DEFAULT_MAX_CHUNKS = 16
+DEFAULT_TEMPERATURE = 0.3
 
 
-class Settings(BaseSettings):
+@dataclass(slots=True, frozen=True)
+class Settings:
     """Runtime configuration loaded from environment variables."""
 
-    api_key: str = os.getenv("GOOGLE_AI_API_KEY") or ""
-    model: str = os.getenv("GEMINI_MODEL", "models/gemini-1.5-flash-002")
-    file_search_store: Optional[str] = os.getenv("FILE_SEARCH_STORE_ID")
-    max_chunks: int = int(os.getenv("MAX_CHUNKS", 16))
-    temperature: float = float(os.getenv("TEMPERATURE", 0.3))
-
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    api_key: str = ""
+    model: str = DEFAULT_MODEL
+    file_search_store: Optional[str] = None
+    max_chunks: int = DEFAULT_MAX_CHUNKS
+    temperature: float = DEFAULT_TEMPERATURE
 
     @classmethod
     def from_env(cls) -> "Settings":
-        load_dotenv()
-        if not (os.getenv("GOOGLE_AI_API_KEY") or cls().api_key):
+        _load_dotenv()
+        env = os.environ
+        settings = cls(
+            api_key=env.get("GOOGLE_AI_API_KEY") or "",
+            model=env.get("GEMINI_MODEL") or DEFAULT_MODEL,
+            file_search_store=env.get("FILE_SEARCH_STORE_ID") or None,
+            max_chunks=int(env.get("MAX_CHUNKS") or DEFAULT_MAX_CHUNKS),
+            temperature=float(env.get("TEMPERATURE") or DEFAULT_TEMPERATURE),
+        )
+        if not settings.api_key:
             raise RuntimeError("GOOGLE_AI_API_KEY is not set.")
-        return cls()
+        return settings
+
+
+def _load_dotenv() -> bool:
+    """Load a .env file; python-dotenv is optional and only imported here."""
+
+    try:
+        from dotenv import load_dotenv
+    except ImportError:  # pragma: no cover - optional dependency
+        return False
+    return load_dotenv(encoding="utf-8")
 
 
 @lru_cache
@@ -43,4 +51,3 @@ def get_settings() -> Settings:
     """Return cached Settings instance."""
 
     return Settings.from_env()
-
@@ -1,28 +1,78 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
+import inspect
+import random
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, List, Optional
 
-from google import genai
-from google.genai import types
+import orjson
 
 from .config import Settings, get_settings
 
-POLL_SECONDS = 5
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import httpx
+    from google.genai import types
+
+POLL_INITIAL_SECONDS = 0.25
+POLL_MAX_SECONDS = 5.0
+POLL_BACKOFF = 1.5
+MAX_UPLOAD_WORKERS = 8
+SYSTEM_INSTRUCTION = (
+    "Answer concisely using the provided search results. "
+    "Always cite sources when relevant."
+)
+
+
+@lru_cache(maxsize=1)
+def _http_client() -> httpx.Client:
+    """Shared client for REST fallbacks so TLS sessions are reused across calls."""
+
+    import httpx
+
+    client = httpx.Client(
+        timeout=30.0,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=10),
+    )
+    atexit.register(client.close)
+    return client
+
+
+@lru_cache(maxsize=1)
+def _sdk_types() -> SimpleNamespace:
+    """Resolve the optional google.genai request types once per process."""
+
+    from google.genai import types
+
+    return SimpleNamespace(
+        part=getattr(types, "Part", None),
+        content=getattr(types, "Content", None),
+        file_search=getattr(types, "FileSearchToolConfig", None),
+        tool=getattr(types, "Tool", None),
+        generate_config=getattr(types, "GenerateContentConfig", None),
+    )
 
 
 class FileSearchManager:
     """Convenience wrapper around the Gemini File Search APIs."""
 
     def __init__(self, settings: Optional[Settings] = None) -> None:
+        from google import genai
+
         self.settings = settings or get_settings()
         self.client = genai.Client(api_key=self.settings.api_key)
         self._stores_api = getattr(self.client, "file_search_stores", None)
         self._file_search_api = getattr(self.client, "file_search", None)
         self._operations_api = getattr(self.client, "operations", None)
+        self._resolved_store_id: Optional[str] = None
 
     # --- store management -------------------------------------------------
 
@@ -62,15 +112,22 @@ class FileSearchManager:
         if self.settings.file_search_store:
             return self.settings.file_search_store
 
+        # The default store is stable for the manager's lifetime; resolve it once.
+        if self._resolved_store_id:
+            return self._resolved_store_id
+
         # Try to get an existing store first
         stores = self.list_stores()
         if stores:
             # Return the first available store
             first_store = stores[0]
-            return getattr(first_store, "name", None) or first_store.get("name")
+            store_id = getattr(first_store, "name", None) or first_store.get("name")
+        else:
+            # Create a new store if none exist
+            store_id = self.create_store(display_name)
 
-        # Create a new store if none exist
-        return self.create_store(display_name)
+        self._resolved_store_id = store_id
+        return store_id
 
     def list_files(self, store: Optional[str] = None):
         store_id = store or self.ensure_store()
@@ -93,45 +150,60 @@ class FileSearchManager:
         """Upload local files to File Search and optionally block until ready."""
 
         store_id = store or self.ensure_store()
-        uploaded: List[types.Operation] = []
         paths_list = list(paths)
         display_list = list(display_names) if display_names else [None] * len(paths_list)
 
         if display_names and len(display_list) != len(paths_list):
             raise ValueError("display_names length must match paths length.")
 
-        for idx, path in enumerate(paths_list):
+        resolved: List[Path] = []
+        for path in paths_list:
             path = Path(path).expanduser().resolve()
             if not path.exists():
                 raise FileNotFoundError(path)
+            resolved.append(path)
 
-            display_name = display_list[idx] or path.name
-            if self._stores_api and hasattr(self._stores_api, "upload_to_file_search_store"):
-                operation = self._stores_api.upload_to_file_search_store(
-                    file=str(path),
-                    file_search_store_name=store_id,
-                    config={"display_name": display_name},
-                )
-            elif self._file_search_api and hasattr(self._file_search_api, "upload_file"):
-                operation = self._file_search_api.upload_file(store=store_id, path=str(path))
-            else:  # pragma: no cover - unexpected SDK shape
-                raise RuntimeError("Upload API not available in client.")
+        if not resolved:
+            return []
 
-            uploaded.append(operation)
+        def _upload_and_wait(path: Path, display_name: str) -> types.Operation:
+            operation = self._upload_one(path, display_name, store_id)
+            return self.wait_until_ready(operation) if wait else operation
 
-        if wait:
-            for idx, operation in enumerate(uploaded):
-                uploaded[idx] = self.wait_until_ready(operation)
+        # Uploads and readiness polling are network-bound, so run them concurrently.
+        uploaded: List[Optional[types.Operation]] = [None] * len(resolved)
+        with ThreadPoolExecutor(max_workers=min(MAX_UPLOAD_WORKERS, len(resolved))) as pool:
+            futures = {
+                pool.submit(_upload_and_wait, path, display_list[idx] or path.name): idx
+                for idx, path in enumerate(resolved)
+            }
+            for future in as_completed(futures):
+                uploaded[futures[future]] = future.result()
 
         return uploaded
 
+    def _upload_one(self, path: Path, display_name: str, store_id: str) -> types.Operation:
+        if self._stores_api and hasattr(self._stores_api, "upload_to_file_search_store"):
+            return self._stores_api.upload_to_file_search_store(
+                file=str(path),
+                file_search_store_name=store_id,
+                config={"display_name": display_name},
+            )
+        if self._file_search_api and hasattr(self._file_search_api, "upload_file"):
+            return self._file_search_api.upload_file(store=store_id, path=str(path))
+        raise RuntimeError("Upload API not available in client.")  # pragma: no cover - unexpected SDK shape
+
     def wait_until_ready(self, operation: types.Operation) -> types.Operation:
         current = operation
+        delay = POLL_INITIAL_SECONDS
         while True:
             done = getattr(current, "done", None)
             if done or (isinstance(current, dict) and current.get("done")):
                 break
-            time.sleep(POLL_SECONDS)
+            # Exponential backoff with jitter: small uploads finish well under a
+            # second, so avoid quantizing time-to-ready to a fixed poll interval.
+            time.sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(POLL_MAX_SECONDS, delay * POLL_BACKOFF)
             if self._operations_api and hasattr(self._operations_api, "get"):
                 current = self._operations_api.get(operation=current)
             else:
@@ -164,10 +236,9 @@ class FileSearchManager:
         except Exception:
             rest_name = name.replace("/upload/operations/", "/operations/")
             url = f"https://generativelanguage.googleapis.com/v1beta/{rest_name}"
-            with httpx.Client(timeout=30.0) as client:
-                response = client.get(url, params={"key": self.settings.api_key})
-                response.raise_for_status()
-                return response.json()
+            response = _http_client().get(url, params={"key": self.settings.api_key})
+            response.raise_for_status()
+            return orjson.loads(response.content)
 
     def get_document_metadata(self, document_path: str):
         if not document_path:
@@ -181,19 +252,16 @@ class FileSearchManager:
                 pass
 
         url = f"https://generativelanguage.googleapis.com/v1beta/{document_path}"
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, params={"key": self.settings.api_key})
-            response.raise_for_status()
-            return response.json()
+        response = _http_client().get(url, params={"key": self.settings.api_key})
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     # --- querying ---------------------------------------------------------
 
     def _to_contents(self, question: str):
-        part_cls = getattr(types, "Part", None)
-        content_cls = getattr(types, "Content", None)
-        if part_cls and content_cls:
-            part = part_cls(text=question)
-            return [content_cls(role="user", parts=[part])]
+        sdk = _sdk_types()
+        if sdk.part and sdk.content:
+            return [sdk.content(role="user", parts=[sdk.part(text=question)])]
         return [{"role": "user", "parts": [{"text": question}]}]
 
     def _build_tool_config(self, store_id: str):
@@ -202,38 +270,48 @@ class FileSearchManager:
         else:
             payload = {"store": store_id}
 
-        file_search_cls = getattr(types, "FileSearchToolConfig", None)
-        tool_cls = getattr(types, "Tool", None)
-
-        if file_search_cls:
-            fs_config = file_search_cls(**payload)
-            if tool_cls:
-                return tool_cls(file_search=fs_config)
+        sdk = _sdk_types()
+        if sdk.file_search:
+            fs_config = sdk.file_search(**payload)
+            if sdk.tool:
+                return sdk.tool(file_search=fs_config)
             return {"file_search": fs_config}
 
-        if tool_cls:
-            return tool_cls(file_search=payload)
+        if sdk.tool:
+            return sdk.tool(file_search=payload)
 
         return {"file_search": payload}
 
     def _build_generate_config(self, tool, temperature: float):
-        generate_config_cls = getattr(types, "GenerateContentConfig", None)
+        generate_config_cls = _sdk_types().generate_config
         if generate_config_cls:
             return generate_config_cls(
                 tools=[tool],
                 temperature=temperature,
-                system_instruction=(
-                    "Answer concisely using the provided search results. "
-                    "Always cite sources when relevant."
-                ),
+                system_instruction=SYSTEM_INSTRUCTION,
             )
         return {
             "tools": [tool],
             "temperature": temperature,
-            "system_instruction": (
-                "Answer concisely using the provided search results. "
-                "Always cite sources when relevant."
-            ),
+            "system_instruction": SYSTEM_INSTRUCTION,
+        }
+
+    def _generate_kwargs(
+        self,
+        question: str,
+        store: Optional[str],
+        max_chunks: Optional[int],
+        temperature: Optional[float],
+    ) -> dict:
+        store_id = store or self.ensure_store()
+        max_chunks = max_chunks or self.settings.max_chunks
+        temperature = temperature if temperature is not None else self.settings.temperature
+
+        tool = self._build_tool_config(store_id)
+        return {
+            "model": self.settings.model,
+            "contents": self._to_contents(question),
+            "config": self._build_generate_config(tool, temperature),
         }
 
     def ask(
@@ -242,23 +320,47 @@ class FileSearchManager:
         store: Optional[str] = None,
         max_chunks: Optional[int] = None,
         temperature: Optional[float] = None,
+        stream: bool = False,
     ):
-        """Submit a grounded question to Gemini using File Search."""
+        """Submit a grounded question to Gemini using File Search.
 
-        store_id = store or self.ensure_store()
-        max_chunks = max_chunks or self.settings.max_chunks
-        temperature = temperature if temperature is not None else self.settings.temperature
+        With ``stream=True`` an iterator of partial responses is returned instead
+        of the complete response.
+        """
 
-        tool = self._build_tool_config(store_id)
-        config = self._build_generate_config(tool, temperature)
+        kwargs = self._generate_kwargs(question, store, max_chunks, temperature)
+        if stream:
+            return self.client.models.generate_content_stream(**kwargs)
+        return self.client.models.generate_content(**kwargs)
 
-        response = self.client.models.generate_content(
-            model=self.settings.model,
-            contents=self._to_contents(question),
-            config=config,
-        )
+    async def ask_stream(
+        self,
+        question: str,
+        store: Optional[str] = None,
+        max_chunks: Optional[int] = None,
+        temperature: Optional[float] = None,
+    ) -> AsyncIterator[Any]:
+        """Stream partial responses for a grounded question without blocking the loop.
 
-        return response
+        The final partial response carries the grounding metadata for citations.
+        """
+
+        # Resolving the default store may hit the network; keep it off the loop.
+        store = store or await asyncio.to_thread(self.ensure_store)
+        kwargs = self._generate_kwargs(question, store, max_chunks, temperature)
+        stream = self.client.aio.models.generate_content_stream(**kwargs)
+        # Older google-genai releases return the async iterator directly.
+        if inspect.isawaitable(stream):
+            stream = await stream
+        async for chunk in stream:
+            yield chunk
+
+
+@lru_cache(maxsize=1)
+def get_manager() -> FileSearchManager:
+    """Return a process-wide FileSearchManager so the genai client is reused."""
+
+    return FileSearchManager()
 
 
 # --------------------------------------------------------------------------- #
@@ -266,7 +368,7 @@ class FileSearchManager:
 
 
 def _ingest_command(args: argparse.Namespace) -> None:
-    manager = FileSearchManager()
+    manager = get_manager()
     store = manager.ensure_store(display_name=args.display_name)
     operations = manager.upload_files(args.paths, store=store, wait=not args.no_wait)
     for op in operations:
@@ -280,14 +382,27 @@ def _ingest_command(args: argparse.Namespace) -> None:
 
 
 def _query_command(args: argparse.Namespace) -> None:
-    manager = FileSearchManager()
-    response = manager.ask(args.question, max_chunks=args.max_chunks, temperature=args.temperature)
-    print(getattr(response, "text", str(response)))
-    candidate = response.candidates[0]
-    grounding = (
-        getattr(candidate, "grounding_metadata", None)
-        or getattr(candidate, "groundingMetadata", None)
+    manager = get_manager()
+    stream = manager.ask(
+        args.question,
+        max_chunks=args.max_chunks,
+        temperature=args.temperature,
+        stream=True,
     )
+    grounding = None
+    for chunk in stream:
+        text = getattr(chunk, "text", None)
+        if text:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        candidates = getattr(chunk, "candidates", None)
+        if candidates:
+            grounding = (
+                getattr(candidates[0], "grounding_metadata", None)
+                or getattr(candidates[0], "groundingMetadata", None)
+                or grounding
+            )
+    print()
     if grounding:
         chunks = (
             getattr(grounding, "grounding_chunks", None)
@@ -4,44 +4,124 @@ import asyncio
 import mimetypes
 import shutil
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from urllib.error import URLError
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 from urllib.parse import urlparse
-from urllib.request import Request, urlopen
 
+import orjson
+from cachetools import TTLCache
 from fastapi import Depends, FastAPI, File, HTTPException, UploadFile
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, HttpUrl
 
-from .file_search import FileSearchManager
+from .file_search import FileSearchManager, get_manager
 
-app = FastAPI(title="RAG Maker", version="0.2.0")
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import aiohttp
+
+app = FastAPI(title="RAG Maker", version="0.2.0", default_response_class=ORJSONResponse)
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 WEB_DIR = PROJECT_ROOT / "web"
 
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+URL_DOWNLOAD_CONCURRENCY = 5
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Document metadata cited by /ask rarely changes; share lookups across requests.
+_DOC_META: TTLCache = TTLCache(maxsize=1024, ttl=300)
+
 if WEB_DIR.exists():
     app.mount("/assets", StaticFiles(directory=WEB_DIR), name="ui-assets")
 
 
-def get_manager() -> FileSearchManager:
-    return FileSearchManager()
+def _http_session() -> aiohttp.ClientSession:
+    """Return the aiohttp session bound to the running event loop.
+
+    A session cannot outlive its loop, and hosts that run each request on a
+    fresh loop never fire shutdown hooks, so sessions are cached per loop and
+    entries for closed loops are dropped.
+    """
+
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = getattr(app.state, "http_sessions", {})
+    sessions = {key: value for key, value in sessions.items() if not key.is_closed()}
+    session = sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20),
+            headers={"User-Agent": "RAG-Maker/1.0"},
+        )
+        sessions[loop] = session
+    app.state.http_sessions = sessions
+    return session
+
+
+@app.on_event("shutdown")
+async def _close_http_session() -> None:
+    sessions = getattr(app.state, "http_sessions", {})
+    session = sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+def _remote_document_name(url: str, display_name: Optional[str], content_type: str) -> str:
+    parsed = urlparse(url)
+    candidate_name = display_name or Path(parsed.path).name or "remote-document"
+    content_type = (content_type or "").partition(";")[0]
+    suffix = Path(candidate_name).suffix
+    if not suffix:
+        guess = mimetypes.guess_extension(content_type or "")
+        if guess:
+            candidate_name += guess
+    return candidate_name
+
+
+async def _download_remote(url: str, display_name: Optional[str] = None, timeout: float = 60.0) -> tuple[Path, str]:
+    """Stream ``url`` into a named temp file without buffering the body in memory.
+
+    Returns the temp file path, which the caller must unlink, and the display
+    name to register the document under.
+    """
 
+    import aiofiles.tempfile
+    import aiohttp
 
-async def _download_remote_bytes(url: str, timeout: float = 60.0) -> tuple[int, bytes, str]:
-    """Fetch remote content using stdlib so we avoid optional deps."""
+    session = _http_session()
+    path: Optional[Path] = None
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status != 200:
+                raise HTTPException(status_code=response.status, detail="Failed to download remote file.")
+            candidate_name = _remote_document_name(url, display_name, response.headers.get("Content-Type", ""))
+            # The upload infers the MIME type from the file suffix.
+            suffix = Path(candidate_name).suffix
+            async with aiofiles.tempfile.NamedTemporaryFile("wb", delete=False, suffix=suffix) as handle:
+                path = Path(handle.name)
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    await handle.write(chunk)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+        if path is not None:
+            path.unlink(missing_ok=True)
+        raise HTTPException(status_code=400, detail=f"Failed to download remote file: {exc}") from exc
+    except BaseException:
+        if path is not None:
+            path.unlink(missing_ok=True)
+        raise
+    return path, candidate_name
 
-    def _fetch() -> tuple[int, bytes, str]:
-        req = Request(url, headers={"User-Agent": "RAG-Maker/1.0"})
-        with urlopen(req, timeout=timeout) as response:
-            status = response.getcode() or 500
-            data = response.read()
-            content_type = response.headers.get("Content-Type", "")
-        return status, data, content_type
 
-    return await asyncio.to_thread(_fetch)
+async def _download_one(
+    url: str,
+    display_name: Optional[str],
+    semaphore: asyncio.Semaphore,
+) -> tuple[Path, str]:
+    async with semaphore:
+        return await _download_remote(url, display_name)
 
 
 class AskRequest(BaseModel):
@@ -65,28 +145,62 @@ class UrlUploadRequest(BaseModel):
     display_name: Optional[str] = None
 
 
-def _coalesce(obj: Any, *keys: str) -> Optional[Any]:
+class UrlBatchUploadRequest(BaseModel):
+    urls: List[HttpUrl]
+    display_names: Optional[List[str]] = None
+
+
+def _first_key(obj: Dict[str, Any], *keys: str) -> Optional[Any]:
     for key in keys:
-        if isinstance(obj, dict):
-            if key in obj and obj[key] is not None:
-                return obj[key]
-        elif hasattr(obj, key):
-            value = getattr(obj, key)
+        value = obj.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+@lru_cache(maxsize=256)
+def _make_getter(cls: type, keys: Tuple[str, ...]) -> Callable[[Any], Optional[Any]]:
+    """Build a first-non-None lookup of ``keys`` specialized for ``cls``."""
+
+    if issubclass(cls, dict):
+        return lambda obj: _first_key(obj, *keys)
+
+    fields = getattr(cls, "model_fields", None)
+    if isinstance(fields, dict) and getattr(cls, "model_config", {}).get("extra") != "allow":
+        # Pydantic models (the genai SDK types) only carry declared fields, and
+        # probing anything else goes through a slow AttributeError path.
+        keys = tuple(key for key in keys if key in fields or hasattr(cls, key))
+
+    if not keys:
+        return lambda obj: None
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda obj: getattr(obj, key, None)
+
+    def getter(obj: Any) -> Optional[Any]:
+        for key in keys:
+            value = getattr(obj, key, None)
             if value is not None:
                 return value
-    return None
+        return None
+
+    return getter
+
+
+def _coalesce(obj: Any, *keys: str) -> Optional[Any]:
+    return _make_getter(type(obj), keys)(obj)
 
 
 def _serialize_operation(operation: Any, fallback_name: Optional[str] = None) -> Dict[str, Any]:
-    response = _coalesce(operation, "response", "result")
-    document_name = _coalesce(response, "document_name", "documentName", "name")
-    parent = _coalesce(response, "parent", "file_search_store_name", "fileSearchStoreName")
-    display_name = _coalesce(response, "display_name", "displayName") or fallback_name
-    done = bool(
-        _coalesce(operation, "done")
-        or (isinstance(operation, dict) and operation.get("done"))
-    )
-    error_obj = _coalesce(operation, "error")
+    # Pick the dict or attribute accessor once per object, not once per field.
+    op_get = _first_key if isinstance(operation, dict) else _coalesce
+    response = op_get(operation, "response", "result")
+    resp_get = _first_key if isinstance(response, dict) else _coalesce
+    document_name = resp_get(response, "document_name", "documentName", "name")
+    parent = resp_get(response, "parent", "file_search_store_name", "fileSearchStoreName")
+    display_name = resp_get(response, "display_name", "displayName") or fallback_name
+    done = bool(op_get(operation, "done"))
+    error_obj = op_get(operation, "error")
     error_msg = None
     if error_obj:
         if isinstance(error_obj, dict):
@@ -95,7 +209,7 @@ def _serialize_operation(operation: Any, fallback_name: Optional[str] = None) ->
             error_msg = str(error_obj)
 
     return {
-        "operation": _coalesce(operation, "name"),
+        "operation": op_get(operation, "name"),
         "document_name": document_name,
         "display_name": display_name
         or (Path(document_name).name if document_name else None)
@@ -106,27 +220,277 @@ def _serialize_operation(operation: Any, fallback_name: Optional[str] = None) ->
     }
 
 
-def _serialize_file(file_obj: Any) -> Dict[str, Any]:
+def _serialize_file_dict(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "name": item.get("name"),
+        "display_name": _first_key(item, "display_name", "displayName"),
+        "state": item.get("state"),
+        "size_bytes": _first_key(item, "size_bytes", "sizeBytes"),
+        "chunk_count": _first_key(item, "chunk_count", "chunkCount"),
+        "create_time": _first_key(item, "create_time", "createTime"),
+        "update_time": _first_key(item, "update_time", "updateTime"),
+    }
+
+
+def _serialize_file_obj(item: Any) -> Dict[str, Any]:
     return {
-        "name": _coalesce(file_obj, "name"),
-        "display_name": _coalesce(file_obj, "display_name", "displayName"),
-        "state": _coalesce(file_obj, "state"),
-        "size_bytes": _coalesce(file_obj, "size_bytes", "sizeBytes"),
-        "chunk_count": _coalesce(file_obj, "chunk_count", "chunkCount"),
-        "create_time": _coalesce(file_obj, "create_time", "createTime"),
-        "update_time": _coalesce(file_obj, "update_time", "updateTime"),
+        "name": getattr(item, "name", None),
+        "display_name": _coalesce(item, "display_name", "displayName"),
+        "state": getattr(item, "state", None),
+        "size_bytes": _coalesce(item, "size_bytes", "sizeBytes"),
+        "chunk_count": _coalesce(item, "chunk_count", "chunkCount"),
+        "create_time": _coalesce(item, "create_time", "createTime"),
+        "update_time": _coalesce(item, "update_time", "updateTime"),
+    }
+
+
+def _serialize_files(items: List[Any]) -> List[Dict[str, Any]]:
+    # Items from one listing share a type, so check it once for the whole list.
+    serialize = _serialize_file_dict if items and isinstance(items[0], dict) else _serialize_file_obj
+    return [serialize(item) for item in items]
+
+
+def _serialize_store_dict(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "name": item.get("name"),
+        "display_name": _first_key(item, "display_name", "displayName"),
+        "create_time": _first_key(item, "create_time", "createTime"),
+        "update_time": _first_key(item, "update_time", "updateTime"),
+    }
+
+
+def _serialize_store_obj(item: Any) -> Dict[str, Any]:
+    return {
+        "name": getattr(item, "name", None),
+        "display_name": _coalesce(item, "display_name", "displayName"),
+        "create_time": _coalesce(item, "create_time", "createTime"),
+        "update_time": _coalesce(item, "update_time", "updateTime"),
     }
 
 
 def _serialize_store(store_obj: Any) -> Dict[str, Any]:
+    if isinstance(store_obj, dict):
+        return _serialize_store_dict(store_obj)
+    return _serialize_store_obj(store_obj)
+
+
+def _serialize_stores(items: List[Any]) -> List[Dict[str, Any]]:
+    serialize = _serialize_store_dict if items and isinstance(items[0], dict) else _serialize_store_obj
+    return [serialize(item) for item in items]
+
+
+def _first_present(*pairs: Tuple[Dict[str, Any], str]) -> Optional[Any]:
+    """Return the first truthy ``mapping[key]`` across ``(mapping, key)`` pairs."""
+
+    for mapping, key in pairs:
+        value = mapping.get(key)
+        if value:
+            return value
+    return None
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@lru_cache(maxsize=32)
+def _chunk_converter(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """Build a chunk-to-dict converter with attribute lookups resolved for ``cls``."""
+
+    get_id = _make_getter(cls, ("id",))
+    get_reference = _make_getter(cls, ("chunk_reference",))
+    get_title = _make_getter(cls, ("title",))
+    get_display_name = _make_getter(cls, ("display_name",))
+    get_uri = _make_getter(cls, ("uri",))
+    get_snippet = _make_getter(cls, ("snippet",))
+    get_segment = _make_getter(cls, ("segment",))
+    get_retrieved_context = _make_getter(cls, ("retrieved_context",))
+
+    def convert(chunk: Any) -> Dict[str, Any]:
+        chunk_id = get_id(chunk)
+        display_name = get_display_name(chunk)
+        return {
+            "chunk_reference": get_reference(chunk) or chunk_id,
+            "id": chunk_id,
+            "title": get_title(chunk) or display_name,
+            "display_name": display_name,
+            "uri": get_uri(chunk),
+            "snippet": get_snippet(chunk),
+            "segment": get_segment(chunk),
+            "retrieved_context": get_retrieved_context(chunk),
+        }
+
+    return convert
+
+
+def _spill_sync(file: UploadFile) -> tuple[Path, str]:
+    original_name = file.filename or "document"
+    suffix = Path(original_name).suffix or ".tmp"
+    handle = tempfile.NamedTemporaryFile(delete=False, suffix=suffix, buffering=UPLOAD_CHUNK_SIZE)
+    path = Path(handle.name)
+    try:
+        with handle:
+            shutil.copyfileobj(file.file, handle, UPLOAD_CHUNK_SIZE)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return path, original_name
+
+
+async def _spill(file: UploadFile) -> tuple[Path, str]:
+    """Copy an uploaded file to a named temp file in bounded chunks.
+
+    The create/copy/close sequence is blocking disk I/O, so it runs in a
+    worker thread as a single hop instead of on the event loop.
+    """
+
+    return await asyncio.to_thread(_spill_sync, file)
+
+
+async def _resolve_document_metadata(manager: FileSearchManager, paths: Iterable[str]) -> Dict[str, Any]:
+    """Return metadata per document path, fetching cache misses concurrently.
+
+    Failed lookups map to ``{"error": ...}`` and are not cached.
+    """
+
+    resolved: Dict[str, Any] = {}
+    misses: List[str] = []
+    for path in paths:
+        meta = _DOC_META.get(path)
+        if meta is None:
+            misses.append(path)
+        else:
+            resolved[path] = meta
+
+    if misses:
+        fetched = await asyncio.gather(
+            *(asyncio.to_thread(manager.get_document_metadata, path) for path in misses),
+            return_exceptions=True,
+        )
+        for path, meta in zip(misses, fetched):
+            if isinstance(meta, Exception):
+                resolved[path] = {"error": str(meta)}
+                continue
+            if isinstance(meta, BaseException):
+                raise meta
+            _DOC_META[path] = meta
+            resolved[path] = meta
+
+    return resolved
+
+
+class _ChunkFields(NamedTuple):
+    chunk_reference: Optional[str]
+    snippet: Optional[str]
+    title: Optional[str]
+    uri: Optional[str]
+    document_path: Optional[str]
+    context_title: Optional[str]
+    context_uri: Optional[str]
+
+
+def _extract_chunk_raw(chunk_dict: Dict[str, Any]) -> _ChunkFields:
+    """Pull the citation fields out of one grounding chunk."""
+
+    chunk_ref = chunk_dict.get("chunk_reference") or chunk_dict.get("id")
+    segment = chunk_dict.get("segment") or {}
+    if segment and not isinstance(segment, dict):
+        segment = {
+            "title": getattr(segment, "title", None),
+            "text": getattr(segment, "text", None),
+            "snippet": getattr(segment, "snippet", None),
+            "uri": getattr(segment, "uri", None),
+        }
+
+    retrieved_context = chunk_dict.get("retrieved_context") or {}
+    if retrieved_context and not isinstance(retrieved_context, dict):
+        retrieved_context = {
+            "text": getattr(retrieved_context, "text", None),
+            "title": getattr(retrieved_context, "title", None),
+            "uri": getattr(retrieved_context, "uri", None),
+        }
+
+    snippet = chunk_dict.get("snippet")
+    if not snippet and segment:
+        snippet = segment.get("snippet") or segment.get("text")
+    if not snippet and retrieved_context:
+        snippet = retrieved_context.get("text")
+
+    if snippet and len(snippet) > 500:
+        snippet = snippet[:497].rstrip() + "..."
+
+    chunk_title = _first_present(
+        (chunk_dict, "title"),
+        (chunk_dict, "display_name"),
+        (segment, "title"),
+        (retrieved_context, "title"),
+    )
+    uri = _first_present((chunk_dict, "uri"), (segment, "uri"), (retrieved_context, "uri"))
+    document_path = chunk_ref.partition("#")[0] if chunk_ref else None
+
+    return _ChunkFields(
+        chunk_reference=chunk_ref,
+        snippet=snippet,
+        title=chunk_title,
+        uri=uri,
+        document_path=document_path,
+        context_title=retrieved_context.get("title"),
+        context_uri=retrieved_context.get("uri"),
+    )
+
+
+def _make_citation(fields: _ChunkFields, meta: Any) -> Dict[str, Any]:
+    if isinstance(meta, dict):
+        document_display_name = meta.get("displayName") or meta.get("title")
+        document_uri = meta.get("uri")
+        document_error = meta.get("error")
+    else:
+        document_display_name = fields.context_title
+        document_uri = fields.context_uri
+        document_error = None
+
     return {
-        "name": _coalesce(store_obj, "name"),
-        "display_name": _coalesce(store_obj, "display_name", "displayName"),
-        "create_time": _coalesce(store_obj, "create_time", "createTime"),
-        "update_time": _coalesce(store_obj, "update_time", "updateTime"),
+        "id": fields.chunk_reference,
+        "title": fields.title,
+        "uri": fields.uri or document_uri,
+        "snippet": fields.snippet,
+        "chunk_reference": fields.chunk_reference,
+        "document_path": fields.document_path,
+        "document_display_name": document_display_name,
+        "document_uri": document_uri,
+        "document_error": document_error,
     }
 
 
+async def _build_citations(manager: FileSearchManager, grounding: Any) -> List[Dict[str, Any]]:
+    """Turn a candidate's grounding metadata into deduplicated citation dicts."""
+
+    if not grounding:
+        return []
+
+    grounding_get = _first_key if isinstance(grounding, dict) else _coalesce
+    chunks = list(grounding_get(grounding, "grounding_chunks", "groundingChunks") or [])
+    # Chunks in one response share a shape, so pick the converter once.
+    if not chunks or isinstance(chunks[0], dict):
+        to_chunk_dict = _identity
+    else:
+        to_chunk_dict = _chunk_converter(type(chunks[0]))
+
+    # Extract raw fields, resolve every cited document in one fan-out, then build.
+    raw = [_extract_chunk_raw(to_chunk_dict(chunk)) for chunk in chunks]
+    doc_meta = await _resolve_document_metadata(
+        manager, {fields.document_path for fields in raw if fields.document_path}
+    )
+    citations = [_make_citation(fields, doc_meta.get(fields.document_path)) for fields in raw]
+
+    # Keep the first citation per (document, snippet, document name).
+    unique: Dict[tuple, Dict[str, Any]] = {}
+    for citation in citations:
+        key = (citation["document_path"], citation["snippet"], citation["document_display_name"])
+        unique.setdefault(key, citation)
+    return list(unique.values())
+
+
 @app.get("/", include_in_schema=False)
 async def ui_root():
     if WEB_DIR.exists():
@@ -139,7 +503,7 @@ async def list_stores(manager: FileSearchManager = Depends(get_manager)):
     """List all available file search stores."""
     try:
         stores = manager.list_stores()
-        return {"stores": [_serialize_store(store) for store in stores]}
+        return {"stores": _serialize_stores(stores)}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -187,18 +551,14 @@ async def upload_files(
         raise HTTPException(status_code=400, detail="No files provided.")
 
     temp_paths: List[Path] = []
-    display_names: List[str] = []
     try:
-        for file in files:
-            original_name = file.filename or "document"
-            suffix = Path(original_name).suffix or ".tmp"
-            handle = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-            contents = await file.read()
-            handle.write(contents)
-            handle.flush()
-            handle.close()
-            temp_paths.append(Path(handle.name))
-            display_names.append(original_name)
+        # Spill all files concurrently; every spill settles before cleanup runs.
+        results = await asyncio.gather(*(_spill(file) for file in files), return_exceptions=True)
+        temp_paths = [result[0] for result in results if not isinstance(result, BaseException)]
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        display_names = [name for _path, name in results]
 
         uploaded = manager.upload_files(temp_paths, store=store_id, wait=False, display_names=display_names)
         serialized = [
@@ -218,33 +578,48 @@ async def upload_url(
     store_id: Optional[str] = None,
     manager: FileSearchManager = Depends(get_manager),
 ):
-    temp_dir: Optional[Path] = None
+    target, candidate_name = await _download_remote(str(payload.url), payload.display_name)
     try:
-        try:
-            status, body, content_type = await _download_remote_bytes(str(payload.url))
-        except URLError as exc:
-            raise HTTPException(status_code=400, detail=f"Failed to download remote file: {exc}") from exc
-        if status != 200:
-            raise HTTPException(status_code=status, detail="Failed to download remote file.")
-
-        parsed = urlparse(str(payload.url))
-        candidate_name = payload.display_name or Path(parsed.path).name or "remote-document"
-        content_type = (content_type or "").split(";")[0]
-        suffix = Path(candidate_name).suffix
-        if not suffix:
-            guess = mimetypes.guess_extension(content_type or "")
-            if guess:
-                candidate_name += guess
-
-        temp_dir = Path(tempfile.mkdtemp())
-        target = temp_dir / candidate_name
-        target.write_bytes(body)
-
         uploaded = manager.upload_files([target], store=store_id, wait=False, display_names=[candidate_name])
         return {"uploaded": [_serialize_operation(uploaded[0], fallback_name=candidate_name)]}
     finally:
-        if temp_dir:
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        target.unlink(missing_ok=True)
+
+
+@app.post("/upload-urls")
+async def upload_urls(
+    payload: UrlBatchUploadRequest,
+    store_id: Optional[str] = None,
+    manager: FileSearchManager = Depends(get_manager),
+):
+    if not payload.urls:
+        raise HTTPException(status_code=400, detail="No URLs provided.")
+    if payload.display_names and len(payload.display_names) != len(payload.urls):
+        raise HTTPException(status_code=400, detail="display_names length must match urls length.")
+
+    names = payload.display_names or [None] * len(payload.urls)
+    semaphore = asyncio.Semaphore(URL_DOWNLOAD_CONCURRENCY)
+    paths: List[Path] = []
+    try:
+        results = await asyncio.gather(
+            *(_download_one(str(url), name, semaphore) for url, name in zip(payload.urls, names)),
+            return_exceptions=True,
+        )
+        paths = [result[0] for result in results if not isinstance(result, BaseException)]
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        display_names = [name for _path, name in results]
+        uploaded = manager.upload_files(paths, store=store_id, wait=False, display_names=display_names)
+        serialized = [
+            _serialize_operation(op, fallback_name=display_names[idx])
+            for idx, op in enumerate(uploaded)
+        ]
+        return {"uploaded": serialized}
+    finally:
+        for path in paths:
+            path.unlink(missing_ok=True)
 
 
 @app.get("/files")
@@ -257,7 +632,7 @@ async def list_files(
     except Exception as exc:  # pragma: no cover - surface error
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
-    return {"files": [_serialize_file(item) for item in files]}
+    return {"files": _serialize_files(files)}
 
 
 class OperationStatusResponse(BaseModel):
@@ -297,7 +672,7 @@ async def operation_status(
     )
 
 
-@app.post("/ask", response_model=AskResponse)
+@app.post("/ask", responses={200: {"model": AskResponse}})
 async def ask(
     payload: AskRequest,
     manager: FileSearchManager = Depends(get_manager),
@@ -321,109 +696,43 @@ async def ask(
     if not text:
         raise HTTPException(status_code=502, detail="No content in response.")
 
-    grounding = getattr(candidate, "grounding_metadata", None) or getattr(candidate, "groundingMetadata", None)
-    citations: List[Dict[str, Any]] = []
-    doc_meta_cache: Dict[str, Any] = {}
-    seen_citations = set()
-    if grounding:
-        chunks = (
-            getattr(grounding, "grounding_chunks", None)
-            or getattr(grounding, "groundingChunks", None)
-            or (grounding.get("grounding_chunks") if isinstance(grounding, dict) else None)
-            or (grounding.get("groundingChunks") if isinstance(grounding, dict) else None)
-            or []
-        )
-        for chunk in chunks:
-            chunk_dict = {}
-            if isinstance(chunk, dict):
-                chunk_dict = chunk
-            else:
-                chunk_dict = {
-                    "chunk_reference": getattr(chunk, "chunk_reference", None) or getattr(chunk, "id", None),
-                    "id": getattr(chunk, "id", None),
-                    "title": getattr(chunk, "title", None) or getattr(chunk, "display_name", None),
-                    "display_name": getattr(chunk, "display_name", None),
-                    "uri": getattr(chunk, "uri", None),
-                    "snippet": getattr(chunk, "snippet", None),
-                    "segment": getattr(chunk, "segment", None),
-                    "retrieved_context": getattr(chunk, "retrieved_context", None),
-                }
-
-            chunk_ref = chunk_dict.get("chunk_reference") or chunk_dict.get("id")
-            segment = chunk_dict.get("segment") or {}
-            if segment and not isinstance(segment, dict):
-                segment = {
-                    "title": getattr(segment, "title", None),
-                    "text": getattr(segment, "text", None),
-                    "snippet": getattr(segment, "snippet", None),
-                    "uri": getattr(segment, "uri", None),
-                }
-
-            retrieved_context = chunk_dict.get("retrieved_context") or {}
-            if retrieved_context and not isinstance(retrieved_context, dict):
-                retrieved_context = {
-                    "text": getattr(retrieved_context, "text", None),
-                    "title": getattr(retrieved_context, "title", None),
-                    "uri": getattr(retrieved_context, "uri", None),
-                }
-
-            snippet = chunk_dict.get("snippet")
-            if not snippet and segment:
-                snippet = segment.get("snippet") or segment.get("text")
-            if not snippet and retrieved_context:
-                snippet = retrieved_context.get("text")
-
-            if snippet and len(snippet) > 500:
-                snippet = snippet[:497].rstrip() + "..."
-
-            chunk_title = (
-                chunk_dict.get("title")
-                or chunk_dict.get("display_name")
-                or segment.get("title")
-                or retrieved_context.get("title")
-            )
-            uri = chunk_dict.get("uri") or segment.get("uri") or retrieved_context.get("uri")
-
-            document_path = None
-            if chunk_ref:
-                document_path = chunk_ref.split("#", 1)[0]
-
-            document_display_name = None
-            document_uri = None
-            document_error = None
-            if document_path and document_path not in doc_meta_cache:
-                try:
-                    doc_meta_cache[document_path] = manager.get_document_metadata(document_path)
-                except Exception as meta_exc:  # pragma: no cover - surface to client
-                    doc_meta_cache[document_path] = {"error": str(meta_exc)}
-
-            meta = doc_meta_cache.get(document_path) if document_path else None
-            if isinstance(meta, dict):
-                document_display_name = meta.get("displayName") or meta.get("title")
-                document_uri = meta.get("uri")
-                document_error = meta.get("error")
-            else:
-                document_display_name = document_display_name or retrieved_context.get("title")
-                document_uri = document_uri or retrieved_context.get("uri")
-
-            dedupe_key = (document_path, snippet, document_display_name)
-            if dedupe_key in seen_citations:
-                continue
-            seen_citations.add(dedupe_key)
-
-            citations.append(
-                {
-                    "id": chunk_ref or chunk_dict.get("id"),
-                    "title": chunk_title,
-                    "uri": uri or document_uri,
-                    "snippet": snippet,
-                    "chunk_reference": chunk_ref,
-                    "document_path": document_path,
-                    "document_display_name": document_display_name,
-                    "document_uri": document_uri,
-                    "document_error": document_error,
-                }
-            )
-
-    return AskResponse(answer=text, citations=citations)
+    grounding = _coalesce(candidate, "grounding_metadata", "groundingMetadata")
+    citations = await _build_citations(manager, grounding)
+
+    # The payload is plain str/dict data; skip response-model validation and encoding.
+    return ORJSONResponse({"answer": text, "citations": citations})
+
+
+def _sse_event(data: Dict[str, Any]) -> bytes:
+    return b"data: " + orjson.dumps(data) + b"\n\n"
 
+
+@app.post("/ask/stream")
+async def ask_stream(
+    payload: AskRequest,
+    manager: FileSearchManager = Depends(get_manager),
+):
+    """Stream the answer as Server-Sent Events; citations arrive as the final event."""
+
+    async def events():
+        grounding = None
+        try:
+            async for chunk in manager.ask_stream(
+                payload.question,
+                store=payload.store_id,
+                max_chunks=payload.max_chunks,
+                temperature=payload.temperature,
+            ):
+                text = getattr(chunk, "text", None)
+                if text:
+                    yield _sse_event({"delta": text})
+                candidates = getattr(chunk, "candidates", None)
+                if candidates:
+                    grounding = _coalesce(candidates[0], "grounding_metadata", "groundingMetadata") or grounding
+            citations = await _build_citations(manager, grounding)
+        except Exception as exc:  # pragma: no cover - headers already sent, surface in-band
+            yield _sse_event({"error": str(exc)})
+            return
+        yield _sse_event({"citations": citations})
+
+    return StreamingResponse(events(), media_type="text/event-stream")
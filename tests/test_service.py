@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import functools
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from rag_maker import service
+
+
+class _FakeManager:
+    def upload_files(self, paths, store=None, wait=False, display_names=None):
+        return [{"name": f"op-{index}", "done": True} for index, _ in enumerate(paths)]
+
+
+@pytest.fixture
+def file_server(tmp_path: Path):
+    (tmp_path / "doc.txt").write_text("hello", encoding="utf-8")
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(tmp_path))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def client():
+    service.app.dependency_overrides[service.get_manager] = _FakeManager
+    # No ``with`` block: each request runs on its own event loop.
+    yield TestClient(service.app)
+    service.app.dependency_overrides.clear()
+
+
+def test_upload_url_reuses_no_session_across_event_loops(client: TestClient, file_server: str) -> None:
+    for _ in range(2):
+        response = client.post("/upload-url", json={"url": f"{file_server}/doc.txt"})
+        assert response.status_code == 200, response.text
+
+    # Sessions tied to the finished loops are dropped on the next lookup.
+    assert len(service.app.state.http_sessions) <= 1